@@ -0,0 +1,120 @@
+import sqlite3
+import threading
+import time
+
+# Path to the persistent cache database
+DB_PATH = "wikitruth.db"
+
+# Stored translations older than this are treated as misses, so stale
+# entries age out instead of living forever in the database
+TRANSLATION_TTL = 7 * 86400
+
+# Single shared connection; SQLite serializes writes itself but we guard
+# connection setup and writes so worker threads can use it safely
+_db_lock = threading.Lock()
+_connection = None
+
+def get_connection():
+    """
+    Open (once) and return the shared SQLite connection
+
+    Returns:
+        Connection: Connection with the cache tables created
+    """
+    global _connection
+    with _db_lock:
+        if _connection is None:
+            _connection = sqlite3.connect(DB_PATH, check_same_thread=False)
+            _connection.execute("""
+                CREATE TABLE IF NOT EXISTS highlights (
+                    article_id TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    updated REAL NOT NULL
+                )
+            """)
+            _connection.execute("""
+                CREATE TABLE IF NOT EXISTS translations (
+                    sha1 TEXT NOT NULL,
+                    src TEXT NOT NULL,
+                    dst TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    PRIMARY KEY (sha1, dst)
+                )
+            """)
+            _connection.commit()
+        return _connection
+
+def get_highlights_payload(article_id):
+    """
+    Read the stored highlights payload for an article
+
+    Args:
+        article_id (str): Unique identifier for the article
+
+    Returns:
+        str: Serialized highlight list, or None if the article has none
+    """
+    conn = get_connection()
+    row = conn.execute(
+        "SELECT payload FROM highlights WHERE article_id = ?", (article_id,)
+    ).fetchone()
+    return row[0] if row else None
+
+def save_highlights_payload(article_id, payload):
+    """
+    Store (or replace) the highlights payload for an article
+
+    Args:
+        article_id (str): Unique identifier for the article
+        payload (str): Serialized highlight list
+    """
+    conn = get_connection()
+    with _db_lock:
+        conn.execute(
+            "INSERT OR REPLACE INTO highlights (article_id, payload, updated) VALUES (?, ?, ?)",
+            (article_id, payload, time.time())
+        )
+        conn.commit()
+
+def count_highlights():
+    """Return the number of articles with stored highlights"""
+    conn = get_connection()
+    return conn.execute("SELECT COUNT(*) FROM highlights").fetchone()[0]
+
+def get_cached_translation(sha1, dst):
+    """
+    Look up a previously stored translation
+
+    Args:
+        sha1 (str): Key derived from the source text
+        dst (str): Target language code
+
+    Returns:
+        str: Cached translation, or None on a miss or an expired entry
+    """
+    conn = get_connection()
+    row = conn.execute(
+        "SELECT text, created FROM translations WHERE sha1 = ? AND dst = ?", (sha1, dst)
+    ).fetchone()
+    if row and time.time() - row[1] < TRANSLATION_TTL:
+        return row[0]
+    return None
+
+def store_translation(sha1, src, dst, text):
+    """
+    Persist a translation so later sessions skip the API call
+
+    Args:
+        sha1 (str): Key derived from the source text
+        src (str): Source language code
+        dst (str): Target language code
+        text (str): Translated text
+    """
+    conn = get_connection()
+    with _db_lock:
+        conn.execute(
+            "INSERT OR REPLACE INTO translations (sha1, src, dst, text, created) VALUES (?, ?, ?, ?, ?)",
+            (sha1, src, dst, text, time.time())
+        )
+        conn.commit()
@@ -1,10 +1,115 @@
 import io
 import streamlit as st
+from copy import deepcopy
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 import re
 
+# Plain-paragraph template cloned per paragraph; building the subtree once
+# and deep-copying it is much cheaper than add_paragraph's element
+# construction for every body paragraph of a long article
+_PARAGRAPH_TEMPLATE_XML = '<w:p %s><w:r><w:t xml:space="preserve"/></w:r></w:p>' % nsdecls('w')
+
+# Precompiled patterns (module-level so they are built once, not per call)
+# Filename sanitizers
+INVALID_FILENAME_CHARS = re.compile(r'[<>:"|?*]')
+WHITESPACE_RUN = re.compile(r'\s+')
+# Matches one paragraph (text up to the next blank line) so paragraphs can
+# be iterated in place without materializing a split list per section
+PARAGRAPH_PATTERN = re.compile(r'\S[\s\S]*?(?=\n\n|\Z)')
+
+def _iter_lines_with_offsets(content):
+    """
+    Yield (offset, line) pairs without splitting the whole document
+
+    Args:
+        content (str): Document text
+
+    Yields:
+        tuple: (start offset, line without trailing newline)
+    """
+    offset = 0
+    length = len(content)
+    while offset <= length:
+        newline = content.find('\n', offset)
+        if newline == -1:
+            if offset < length:
+                yield offset, content[offset:]
+            return
+        yield offset, content[offset:newline]
+        offset = newline + 1
+
+def _scan_headings(content):
+    """
+    Find wiki-style "== Title ==" headings with a plain line scan
+
+    A heading is a line wrapped in two to six matching '=' signs. The
+    hand-written scan replaces the previous multiline regex, which is a
+    heavyweight tool for such a strictly line-oriented format.
+
+    Args:
+        content (str): Wikipedia article content
+
+    Returns:
+        list: (line start, line end, '=' count, title) tuples in order
+    """
+    headings = []
+    for offset, line in _iter_lines_with_offsets(content):
+        stripped = line.strip()
+        if len(stripped) >= 4 and stripped[0] == '=' and stripped[-1] == '=':
+            depth = 0
+            half = len(stripped) // 2
+            while depth < half and stripped[depth] == '=' and stripped[-depth - 1] == '=':
+                depth += 1
+            if depth >= 2:
+                title = stripped[depth:len(stripped) - depth].strip()
+                headings.append((offset, offset + len(line), min(depth, 6), title))
+    return headings
+
+def _strip_slice(content, start, end):
+    """
+    Slice content[start:end] with surrounding whitespace removed
+
+    Advances the bounds past whitespace first so only one trimmed string
+    is allocated, instead of slicing and then stripping a copy.
+
+    Args:
+        content (str): Full document text
+        start (int): Slice start offset
+        end (int): Slice end offset
+
+    Returns:
+        str: Trimmed slice
+    """
+    while start < end and content[start].isspace():
+        start += 1
+    while end > start and content[end - 1].isspace():
+        end -= 1
+    return content[start:end]
+
+def _append_plain_paragraphs(doc, texts):
+    """
+    Append unstyled paragraphs to the document body in one batch
+
+    Args:
+        doc (Document): Document to append to
+        texts (iterable): Paragraph texts, one paragraph each
+    """
+    body = doc.element.body
+    sect_pr = body.find(qn('w:sectPr'))
+    template = parse_xml(_PARAGRAPH_TEMPLATE_XML)
+
+    for text in texts:
+        paragraph = deepcopy(template)
+        paragraph[0][0].text = text  # w:p -> w:r -> w:t
+        if sect_pr is not None:
+            sect_pr.addprevious(paragraph)
+        else:
+            body.append(paragraph)
+
 def create_wiki_document(article, language_name, is_translated=False, translated_to=None):
     """
     Creates a DOCX document from Wikipedia article content
@@ -14,9 +119,9 @@ def create_wiki_document(article, language_name, is_translated=False, translated
         language_name (str): Name of the language the article is in
         is_translated (bool): Whether this is a translated version
         translated_to (str): Name of the language the article was translated to
-        
+
     Returns:
-        BytesIO: Document as a bytes buffer
+        BytesIO: Document as an in-memory binary buffer
     """
     doc = Document()
     
@@ -64,18 +169,22 @@ def create_wiki_document(article, language_name, is_translated=False, translated
         if section["title"]:
             level = min(section["level"], 5)  # Cap at heading level 5
             doc.add_heading(section["title"], level=level)
-        
-        # Add the content
-        paragraphs = section["content"].split("\n\n")
-        for paragraph in paragraphs:
-            if paragraph.strip():
-                doc.add_paragraph(paragraph.strip())
+
+        # Add the content; plain paragraphs go through the batched
+        # template path, yielded one span at a time rather than via a
+        # full split list per section
+        _append_plain_paragraphs(
+            doc,
+            (match.group().strip() for match in PARAGRAPH_PATTERN.finditer(section["content"]))
+        )
     
-    # Save to bytes buffer
+    # Save to an in-memory buffer; st.download_button only accepts the
+    # io classes it knows (BytesIO among them), so a spooled temp file
+    # is not an option here
     doc_buffer = io.BytesIO()
     doc.save(doc_buffer)
     doc_buffer.seek(0)
-    
+
     return doc_buffer
 
 def split_content_into_sections(content):
@@ -88,52 +197,36 @@ def split_content_into_sections(content):
     Returns:
         list: List of dictionaries with section titles and content
     """
-    # Find all section headings using regex
-    # This pattern matches heading patterns like "== Title ==" or "=== Subsection ==="
-    heading_pattern = re.compile(r'^(={2,6})\s*(.*?)\s*\1', re.MULTILINE)
-    
-    # Find all headings and their positions
-    headings = []
-    for match in heading_pattern.finditer(content):
-        level = len(match.group(1))
-        title = match.group(2)
-        pos = match.start()
-        headings.append((pos, level, title))
-    
-    # Sort headings by position
-    headings.sort()
-    
+    # Find all headings and their positions in one linear line scan; each
+    # entry carries the heading's end offset so sections slice directly
+    headings = _scan_headings(content)
+
     # Create sections
     sections = []
-    
+
     # Add the initial section (before the first heading)
     if headings:
         first_pos = headings[0][0]
-        intro_content = content[:first_pos].strip()
+        intro_content = _strip_slice(content, 0, first_pos)
         if intro_content:
             sections.append({
                 "title": None,
                 "content": intro_content,
                 "level": 0
             })
-    
+
     # Process each heading and its content
     for i in range(len(headings)):
-        pos, level, title = headings[i]
-        
+        pos, heading_end, level, title = headings[i]
+
         # Calculate where this section ends
         if i < len(headings) - 1:
             end_pos = headings[i+1][0]
         else:
             end_pos = len(content)
-        
-        # Get the heading match to skip it
-        heading_match = heading_pattern.search(content[pos:end_pos])
-        if heading_match:
-            section_content = content[pos + heading_match.end():end_pos].strip()
-        else:
-            section_content = content[pos:end_pos].strip()
-        
+
+        section_content = _strip_slice(content, heading_end, end_pos)
+
         sections.append({
             "title": title,
             "content": section_content,
@@ -165,9 +258,9 @@ def get_download_filename(article_title, is_translated=False, language_code=None
     # Clean title for use in filename - keep it more readable
     # Remove special characters that aren't allowed in filenames
     clean_title = article_title.replace("/", "-").replace("\\", "-")
-    clean_title = re.sub(r'[<>:"|?*]', '', clean_title)
+    clean_title = INVALID_FILENAME_CHARS.sub('', clean_title)
     # Replace multiple spaces with a single underscore for readability
-    clean_title = re.sub(r'\s+', '_', clean_title)
+    clean_title = WHITESPACE_RUN.sub('_', clean_title)
     
     if is_translated:
         return f"Wikipedia-{clean_title}-translated_to_{language_code}.docx"
@@ -1,59 +1,346 @@
 import streamlit as st
+import functools
+import hashlib
 import json
 import os
 import re
 import time
+from collections import defaultdict
 
-# Path to the highlights storage file
-HIGHLIGHTS_FILE = "data/highlights.json"
+import cache
+
+try:
+    import hyperscan  # optional JIT-compiled multi-pattern matcher (x86)
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick  # pyahocorasick: optional fast multi-pattern matcher
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # optional C-implemented JSON, 3-5x faster than stdlib
+except ImportError:
+    orjson = None
+
+def _dumps_line(record):
+    """Serialize one highlight record to a JSON string (orjson if available)"""
+    if orjson is not None:
+        return orjson.dumps(record).decode()
+    return json.dumps(record)
+
+def _loads(data):
+    """Parse a JSON document or line (orjson if available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Path to the highlights storage file (append-only JSON lines log)
+HIGHLIGHTS_FILE = "data/highlights.jsonl"
+# Older deployments stored one big JSON document; migrated on first load
+LEGACY_HIGHLIGHTS_FILE = "data/highlights.json"
+
+@functools.lru_cache(maxsize=1024)
+def _compile_highlight_pattern(highlights_texts):
+    """
+    Compile (and cache) a single alternation pattern matching all highlights
+
+    The alternation is built longest-first so nested highlights keep their
+    leftmost-longest behavior, and each branch is escaped so the pattern is
+    always valid.
+
+    Args:
+        highlights_texts (tuple): Highlight texts sorted longest-first
+
+    Returns:
+        Pattern: Compiled pattern with word-boundary guards
+    """
+    alternation = "|".join(re.escape(text) for text in highlights_texts)
+    return re.compile(f"(?<![a-zA-Z0-9])({alternation})(?![a-zA-Z0-9])")
+
+def _is_word_char(char):
+    """Check whether a character counts as a word character for boundaries"""
+    return char.isascii() and char.isalnum()
+
+@functools.lru_cache(maxsize=256)
+def _build_automaton(highlights_texts):
+    """
+    Build (and cache) an Aho-Corasick automaton over the highlight texts
+
+    The automaton only depends on the highlight set, so one build is
+    shared across every section of the article and across reruns instead
+    of being rebuilt per apply call.
+
+    Args:
+        highlights_texts (tuple): Highlight texts to match
+
+    Returns:
+        Automaton: Automaton ready for iteration over the text
+    """
+    automaton = ahocorasick.Automaton()
+    for highlight_text in highlights_texts:
+        automaton.add_word(highlight_text, highlight_text)
+    automaton.make_automaton()
+    return automaton
+
+def _apply_highlights_ahocorasick(text, highlights_texts):
+    """
+    Mark all highlights in a single automaton pass over the text
+
+    Finds every needle in one O(len(text)) scan, applies the same word
+    boundary rules as the regex path, resolves overlapping matches
+    longest-first, then splices <mark> tags around the accepted spans.
+
+    Args:
+        text (str): The original text
+        highlights_texts (tuple): Highlight texts sorted longest-first
+
+    Returns:
+        str: Text with highlight markup
+    """
+    automaton = _build_automaton(highlights_texts)
+
+    # Collect candidate spans with the boundary checks from the regex path
+    candidates = []
+    for end_index, matched in automaton.iter(text):
+        start = end_index - len(matched) + 1
+        end = end_index + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < len(text) and _is_word_char(text[end]):
+            continue
+        candidates.append((start, end))
+
+    if not candidates:
+        return text
+
+    accepted = _resolve_spans(candidates)
+
+    # Splice the <mark> tags around the accepted spans in one join pass
+    pieces = []
+    cursor = 0
+    for start, end in accepted:
+        pieces.append(text[cursor:start])
+        pieces.append(f"<mark>{text[start:end]}</mark>")
+        cursor = end
+    pieces.append(text[cursor:])
+    return "".join(pieces)
+
+def _resolve_spans(candidates):
+    """
+    Resolve overlapping match spans, longest-first
+
+    Args:
+        candidates (list): (start, end) span tuples
+
+    Returns:
+        list: Accepted non-overlapping spans sorted by position
+    """
+    candidates.sort(key=lambda span: (span[0] - span[1], span[0]))
+    accepted = []
+    for start, end in candidates:
+        if all(end <= a_start or start >= a_end for a_start, a_end in accepted):
+            accepted.append((start, end))
+    accepted.sort()
+    return accepted
+
+def _is_word_byte(byte):
+    """Byte-level equivalent of _is_word_char for the Hyperscan path"""
+    return 48 <= byte <= 57 or 65 <= byte <= 90 or 97 <= byte <= 122
+
+@functools.lru_cache(maxsize=256)
+def _build_hyperscan_db(patterns):
+    """
+    Compile (and cache) a Hyperscan database over escaped highlight bytes
+
+    Args:
+        patterns (tuple): UTF-8 encoded, regex-escaped highlight texts
+
+    Returns:
+        Database: Compiled database reporting start-of-match offsets
+    """
+    db = hyperscan.Database()
+    db.compile(
+        expressions=list(patterns),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(patterns)
+    )
+    return db
+
+def _apply_highlights_hyperscan(text, highlights_texts):
+    """
+    Mark all highlights using a Hyperscan scan over the UTF-8 bytes
+
+    Hyperscan reports byte offsets, so the whole pass works on bytes —
+    boundary checks, overlap resolution and splicing — and decodes back
+    to str at the end.
+
+    Args:
+        text (str): The original text
+        highlights_texts (tuple): Highlight texts sorted longest-first
+
+    Returns:
+        str: Text with highlight markup
+    """
+    data = text.encode("utf-8")
+    patterns = tuple(re.escape(t).encode("utf-8") for t in highlights_texts)
+    db = _build_hyperscan_db(patterns)
+
+    candidates = []
+
+    def on_match(pattern_id, start, end, flags, context):
+        candidates.append((start, end))
+
+    db.scan(data, match_event_handler=on_match)
+
+    # Apply the same word-boundary rules as the other matchers
+    candidates = [
+        (start, end) for start, end in candidates
+        if not (start > 0 and _is_word_byte(data[start - 1]))
+        and not (end < len(data) and _is_word_byte(data[end]))
+    ]
+
+    if not candidates:
+        return text
+
+    accepted = _resolve_spans(candidates)
+
+    pieces = []
+    cursor = 0
+    for start, end in accepted:
+        pieces.append(data[cursor:start])
+        pieces.append(b"<mark>" + data[start:end] + b"</mark>")
+        cursor = end
+    pieces.append(data[cursor:])
+    return b"".join(pieces).decode("utf-8")
 
 def ensure_data_dir_exists():
     """Ensure the data directory exists"""
     os.makedirs("data", exist_ok=True)
 
+def _migrate_legacy_highlights():
+    """Convert the old single-document JSON file to the JSONL log once"""
+    if os.path.exists(HIGHLIGHTS_FILE) or not os.path.exists(LEGACY_HIGHLIGHTS_FILE):
+        return
+
+    try:
+        with open(LEGACY_HIGHLIGHTS_FILE, 'rb') as f:
+            legacy_data = _loads(f.read())
+    except (ValueError, FileNotFoundError):
+        return
+
+    save_highlights(legacy_data)
+
 def load_highlights():
     """
-    Load all highlights from the JSON file
-    
+    Load all highlights from the JSONL log, grouped by article
+
+    Only used to seed the SQLite cache from older file-based deployments;
+    the hot path reads from the database.
+
     Returns:
         dict: Dictionary of all highlights
     """
     ensure_data_dir_exists()
-    
+    _migrate_legacy_highlights()
+
     if not os.path.exists(HIGHLIGHTS_FILE):
         return {}
-    
+
+    all_highlights = defaultdict(list)
     try:
         with open(HIGHLIGHTS_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        # If file is corrupted or doesn't exist, return empty dict
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    # Skip a torn/corrupted line rather than losing the log
+                    continue
+                article_id = record.pop("article_id", None)
+                if article_id:
+                    all_highlights[article_id].append(record)
+    except FileNotFoundError:
         return {}
 
+    return dict(all_highlights)
+
 def save_highlights(highlights_data):
     """
-    Save all highlights to the JSON file
-    
+    Rewrite the full JSONL log (used for migration and compaction)
+
     Args:
         highlights_data (dict): Dictionary of all highlights
     """
     ensure_data_dir_exists()
-    
+
     with open(HIGHLIGHTS_FILE, 'w') as f:
-        json.dump(highlights_data, f, indent=2)
+        for article_id, records in highlights_data.items():
+            for record in records:
+                f.write(_dumps_line({"article_id": article_id, **record}) + "\n")
+
+def make_article_id(title, language):
+    """
+    Build a stable, fixed-length identifier for an article in a language
+
+    Hashing keeps the storage and dict keys short regardless of how long
+    or Unicode-heavy the article title is.
+
+    Args:
+        title (str): Article title
+        language (str): Language code
 
-def get_highlights(article_id):
+    Returns:
+        str: 16-character hex identifier
+    """
+    return hashlib.blake2b(f"{title}|{language}".encode(), digest_size=8).hexdigest()
+
+_db_seeded = False
+
+def _seed_db_from_files():
+    """Import highlights from the old file-based storage into SQLite once"""
+    global _db_seeded
+    if _db_seeded:
+        return
+    _db_seeded = True
+
+    if cache.count_highlights() > 0:
+        return
+
+    for article_id, records in load_highlights().items():
+        cache.save_highlights_payload(article_id, _dumps_line(records))
+
+def _fetch_highlights(article_id):
+    """Read and parse one article's highlight list from the database"""
+    payload = cache.get_highlights_payload(article_id)
+    if not payload:
+        return []
+    try:
+        return _loads(payload)
+    except ValueError:
+        return []
+
+@st.cache_data(show_spinner=False)
+def get_highlights(article_id, legacy_article_id=None):
     """
     Get highlights for a specific article
-    
+
     Args:
         article_id (str): Unique identifier for the article
-        
+        legacy_article_id (str, optional): Pre-hashing "title_lang" key, so
+            highlights saved by older versions still show up
+
     Returns:
         list: List of highlight objects for the article
     """
-    all_highlights = load_highlights()
-    return all_highlights.get(article_id, [])
+    _seed_db_from_files()
+
+    highlights = _fetch_highlights(article_id)
+    if legacy_article_id:
+        highlights = _fetch_highlights(legacy_article_id) + highlights
+    return highlights
 
 def save_highlight(article_id, text_to_highlight, context):
     """
@@ -66,65 +353,92 @@ def save_highlight(article_id, text_to_highlight, context):
     """
     if not text_to_highlight or len(text_to_highlight.strip()) == 0:
         return
-    
-    # Load existing highlights
-    all_highlights = load_highlights()
-    
-    # Get highlights for this article or create empty list
-    article_highlights = all_highlights.get(article_id, [])
-    
-    # Create a new highlight object
+
+    _seed_db_from_files()
+
+    # Append to this article's stored list and write it back; only the
+    # one article's payload is ever re-serialized
     new_highlight = {
         "text": text_to_highlight.strip(),
         "context": context,
         "timestamp": time.time()
     }
-    
-    # Add the new highlight
+
+    article_highlights = _fetch_highlights(article_id)
     article_highlights.append(new_highlight)
-    
-    # Update the highlights for this article
-    all_highlights[article_id] = article_highlights
-    
-    # Save all highlights
-    save_highlights(all_highlights)
+    cache.save_highlights_payload(article_id, _dumps_line(article_highlights))
 
-def apply_highlights_to_text(text, highlights):
+    # Drop cached reads so the new highlight shows up on the next rerun
+    get_highlights.clear()
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def _apply_cached(text, highlights_texts):
     """
-    Apply highlights to a text by wrapping the highlighted phrases in <mark> tags
-    
+    Apply a set of highlight texts to a text, cached per (text, highlights)
+
+    Both arguments are hashable so repeated reruns over the same section
+    with the same highlight set return the cached markup instead of
+    re-running the matcher.
+
     Args:
         text (str): The original text
+        highlights_texts (tuple): Highlight texts sorted longest-first
+
+    Returns:
+        str: Text with highlight markup
+    """
+    # Cheap substring prefilter: most sections contain none of the
+    # highlighted phrases, so skip the matcher entirely in that case and
+    # only match against the phrases that actually appear. Matching is
+    # exact-case: highlights are copy-pasted verbatim from the article,
+    # and skipping Unicode case folding keeps the scan fast
+    present = tuple(t for t in highlights_texts if t in text)
+    if not present:
+        return text
+
+    # Mark every highlight in a single pass over the text. Backend
+    # preference: Hyperscan (fastest, needs x86 binaries), then the
+    # Aho-Corasick automaton, then a single alternation regex
+    if hyperscan is not None:
+        return _apply_highlights_hyperscan(text, present)
+
+    if ahocorasick is not None:
+        return _apply_highlights_ahocorasick(text, present)
+
+    pattern = _compile_highlight_pattern(present)
+    return pattern.sub(lambda m: f"<mark>{m.group(0)}</mark>", text)
+
+def prepare_highlight_texts(highlights):
+    """
+    Build the highlight-text tuple consumed by apply_highlights_to_text
+
+    Unique texts sorted longest-first (so nested highlights resolve to the
+    longer phrase), built once per render and shared across all sections;
+    the tuple also doubles as a stable cache key.
+
+    Args:
         highlights (list): List of highlight objects
-        
+
+    Returns:
+        tuple: Highlight texts sorted longest-first
+    """
+    return tuple(sorted({h["text"] for h in highlights}, key=lambda t: (-len(t), t)))
+
+def apply_highlights_to_text(text, highlight_texts):
+    """
+    Apply highlights to a text by wrapping the highlighted phrases in <mark> tags
+
+    Args:
+        text (str): The original text
+        highlight_texts (tuple): Prepared texts from prepare_highlight_texts
+
     Returns:
         str: Text with highlight markup
     """
-    if not text or not highlights:
+    if not text or not highlight_texts:
         return text
-    
-    # Sort highlights by length (longest first) to handle nested highlights
-    highlights_texts = sorted([h["text"] for h in highlights], key=len, reverse=True)
-    
-    # Replace each highlight with a marked version
-    for highlight_text in highlights_texts:
-        # Escape special regex characters
-        escaped_text = re.escape(highlight_text)
-        # Replace the text with a marked version
-        # Use regex with word boundaries where possible to avoid partial word matches
-        pattern = f"(?<![a-zA-Z0-9]){escaped_text}(?![a-zA-Z0-9])" 
-        try:
-            text = re.sub(
-                pattern, 
-                f"<mark>{highlight_text}</mark>", 
-                text, 
-                flags=re.IGNORECASE
-            )
-        except re.error:
-            # Fallback for complex patterns
-            text = text.replace(highlight_text, f"<mark>{highlight_text}</mark>")
-    
-    return text
+
+    return _apply_cached(text, highlight_texts)
 
 def create_highlight_interface(text, article_id, context):
     """
@@ -0,0 +1,101 @@
+# Language code tables shared by the UI and the Wikipedia helpers.
+# Defined once here so importing both modules allocates one copy of
+# each dict per process instead of rebuilding them per importer.
+
+# Dictionary mapping language codes to language names
+LANGUAGE_DICT = {
+    'en': 'English',
+    'es': 'Spanish',
+    'fr': 'French',
+    'de': 'German',
+    'it': 'Italian',
+    'pt': 'Portuguese',
+    'ru': 'Russian',
+    'ja': 'Japanese',
+    'zh': 'Chinese',
+    'ar': 'Arabic',
+    'hi': 'Hindi',
+    'ko': 'Korean',
+    'nl': 'Dutch',
+    'sv': 'Swedish',
+    'fi': 'Finnish',
+    'no': 'Norwegian',
+    'da': 'Danish',
+    'pl': 'Polish',
+    'uk': 'Ukrainian',
+    'el': 'Greek',
+    'he': 'Hebrew',
+    'id': 'Indonesian',
+    'vi': 'Vietnamese',
+    'fa': 'Persian',
+    'tr': 'Turkish',
+    'cs': 'Czech',
+    'hu': 'Hungarian',
+    'ro': 'Romanian',
+    'th': 'Thai'
+}
+
+# Dictionary mapping language codes to native language names
+NATIVE_LANGUAGE_DICT = {
+    'en': 'English',
+    'es': 'Español',
+    'fr': 'Français',
+    'de': 'Deutsch',
+    'it': 'Italiano',
+    'pt': 'Português',
+    'ru': 'Русский',
+    'ja': '日本語',
+    'zh': '中文',
+    'ar': 'العربية',
+    'hi': 'हिन्दी',
+    'ko': '한국어',
+    'nl': 'Nederlands',
+    'sv': 'Svenska',
+    'fi': 'Suomi',
+    'no': 'Norsk',
+    'da': 'Dansk',
+    'pl': 'Polski',
+    'uk': 'Українська',
+    'el': 'Ελληνικά',
+    'he': 'עברית',
+    'id': 'Bahasa Indonesia',
+    'vi': 'Tiếng Việt',
+    'fa': 'فارسی',
+    'tr': 'Türkçe',
+    'cs': 'Čeština',
+    'hu': 'Magyar',
+    'ro': 'Română',
+    'th': 'ไทย'
+}
+
+# Display labels ("Native - English (code)") for every known language,
+# precomputed at import so building dropdown entries is one dict lookup
+# instead of two name resolutions and an f-string per option per rerun
+LANGUAGE_LABELS = {
+    code: f"{NATIVE_LANGUAGE_DICT.get(code, code)} - {name} ({code})"
+    for code, name in LANGUAGE_DICT.items()
+}
+
+def get_language_name(lang_code):
+    """
+    Get the full language name from a language code
+
+    Args:
+        lang_code (str): Language code (e.g., 'en', 'es')
+
+    Returns:
+        str: Full language name
+    """
+    return LANGUAGE_DICT.get(lang_code, lang_code)
+
+def get_native_language_name(lang_code):
+    """
+    Get the native language name from a language code
+
+    Args:
+        lang_code (str): Language code (e.g., 'en', 'es')
+
+    Returns:
+        str: Native language name
+    """
+    return NATIVE_LANGUAGE_DICT.get(lang_code, lang_code)
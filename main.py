@@ -1,21 +1,28 @@
 import streamlit as st
+import asyncio
 import json
 import os
 import time
+from contextlib import contextmanager
 from wiki_utils import (
     get_wikipedia_search_results,
     get_article_content,
     get_available_languages,
     get_article_in_language,
+    prefetch_articles,
     translate_text,
+    translate_text_stream,
     get_language_name,
     get_native_language_name,
     split_content_into_sections,
     display_collapsible_sections,
-    LANGUAGE_DICT
+    LANGUAGE_DICT,
+    LANGUAGE_LABELS
 )
 from highlight_utils import (
     get_highlights,
+    make_article_id,
+    prepare_highlight_texts,
     save_highlight,
     apply_highlights_to_text,
     create_highlight_interface
@@ -32,122 +39,145 @@ st.set_page_config(
     layout="wide"
 )
 
-# CSS for better UI
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #1E88E5;
-        text-align: center;
-    }
-    .subheader {
-        font-size: 1.5rem;
-        color: #424242;
-        margin-bottom: 1rem;
-    }
-    .article-title {
-        font-size: 2rem;
-        font-weight: bold;
-        color: #1565C0;
-        margin-bottom: 1rem;
-    }
-    .article-summary {
-        font-size: 1.1rem;
-        color: #424242;
-        background-color: #F5F5F5;
-        padding: 1rem;
-        border-radius: 5px;
-        margin-bottom: 1rem;
-    }
-    .lang-button {
-        margin-right: 0.5rem;
-        margin-bottom: 0.5rem;
-    }
-    .article-content {
-        font-size: 1rem;
-        line-height: 1.5;
-    }
-    .wiki-link {
-        color: #1565C0;
-        text-decoration: none;
-    }
-    .wiki-link:hover {
-        text-decoration: underline;
-    }
-    .footer {
-        text-align: center;
-        margin-top: 2rem;
-        font-size: 0.8rem;
-        color: #757575;
-    }
-    .search-tag {
-        display: inline-block;
-        background-color: #E3F2FD;
-        color: #1565C0;
-        padding: 8px 16px;
-        margin: 4px;
-        border-radius: 20px;
-        cursor: pointer;
-        font-weight: 500;
-        transition: all 0.2s;
-        border: 1px solid #BBDEFB;
-    }
-    .search-tag:hover {
-        background-color: #BBDEFB;
-        border-color: #1565C0;
-    }
-    .tag-container {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 8px;
-        margin-bottom: 16px;
-    }
-    /* Style the buttons to look like tags */
-    .stButton button {
-        background-color: #E3F2FD;
-        color: #1565C0;
-        border-radius: 20px;
-        border: 1px solid #BBDEFB;
-        padding: 4px 12px;
-        font-weight: 500;
-        margin: 4px 0;
-        transition: all 0.2s;
-    }
-    .stButton button:hover {
-        background-color: #BBDEFB;
-        border-color: #1565C0;
-    }
-    mark {
-        background-color: #FFFF00;
-        padding: 0 2px;
-    }
-    .highlight-active {
-        cursor: crosshair;
-    }
-    .highlight-btn {
-        background-color: #FFF59D;
-        color: #333;
-        border: 1px solid #FBC02D;
-    }
-    .highlight-btn:hover {
-        background-color: #FFEB3B;
-    }
-    .highlight-instructions {
-        background-color: #FFF9C4;
-        color: #333333;
-        padding: 10px;
-        border-radius: 5px;
-        margin-bottom: 10px;
-        font-size: 0.9rem;
-        border: 1px solid #FBC02D;
-    }
-    .download-btn-container {
-        display: flex;
-        justify-content: center;
-        margin: 15px 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+# CSS for better UI, loaded from disk once per process and injected on
+# each rerun without rebuilding the style block. cache_resource keeps
+# the one string in a module-level slot shared by all sessions, with
+# none of cache_data's per-call copying or key hashing
+@st.cache_resource
+def _load_css():
+    with open("static/styles.css") as f:
+        return f.read()
+
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
+
+def _fragment(func):
+    """
+    Decorate with st.fragment when this Streamlit has it (1.33+), so
+    widget events inside the article body rerun only that block instead
+    of the whole script; otherwise leave the function as-is
+    """
+    return st.fragment(func) if hasattr(st, "fragment") else func
+
+@contextmanager
+def _panel(css_class):
+    """Wrap the enclosed elements in a styled <div> from the stylesheet"""
+    st.markdown(f'<div class="{css_class}">', unsafe_allow_html=True)
+    yield
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# Cached front for translate_text so reruns (toggles, expander clicks)
+# reuse earlier translations instead of re-hitting the translation API
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _translate_cached(text, to_lang, from_lang):
+    return translate_text(text, to_lang, from_lang)
+
+async def _translate_sections_async(sections, to_lang, from_lang, on_progress=None):
+    """
+    Translate all sections concurrently instead of one at a time
+
+    Each section's title and content are dispatched to worker threads and
+    awaited together, so wall-clock time is bounded by the slowest section
+    rather than the sum of all of them.
+
+    Args:
+        sections (list): Section dicts with "title" and "content"
+        to_lang (str): Target language code
+        from_lang (str): Source language code
+        on_progress (callable, optional): Called with (done, total, index,
+            section) from the main thread as each section completes
+
+    Returns:
+        list: Translated section dicts in the original order
+    """
+    async def _translate_section(index, section):
+        title, content = await asyncio.gather(
+            asyncio.to_thread(translate_text, section["title"], to_lang, from_lang, False),
+            asyncio.to_thread(translate_text, section["content"], to_lang, from_lang, False)
+        )
+        return index, {"title": title, "content": content}
+
+    tasks = [_translate_section(i, section) for i, section in enumerate(sections)]
+    results = [None] * len(sections)
+    done = 0
+
+    for future in asyncio.as_completed(tasks):
+        index, translated = await future
+        results[index] = translated
+        done += 1
+        if on_progress:
+            on_progress(done, len(sections), index, translated)
+
+    return results
+
+# Sentinel separators for batching every section into one translation
+# call; these "symbol for control character" code points never occur in
+# article text and pass through the translator untouched
+_SECTION_SEP = "\n␞\n"
+_TITLE_SEP = "\n␟\n"
+
+def _translate_sections_batched(sections, to_lang, from_lang):
+    """
+    Translate all sections in a single round-trip
+
+    Joins every title and content with rare sentinel separators, sends
+    one request, and splits the result back into sections, so N sections
+    cost one call instead of 2N. Returns None when the translator did not
+    preserve the separators; the caller then falls back to per-section
+    translation.
+
+    Args:
+        sections (list): Section dicts with "title" and "content"
+        to_lang (str): Target language code
+        from_lang (str): Source language code
+
+    Returns:
+        list: Translated section dicts in order, or None on failure
+    """
+    payload = _SECTION_SEP.join(
+        (section["title"] or "") + _TITLE_SEP + section["content"]
+        for section in sections
+    )
+    translated = translate_text(payload, to_lang, from_lang, show_progress=False)
+
+    # Split on the bare sentinels: surrounding whitespace may be reflowed
+    parts = translated.split("␞")
+    if len(parts) != len(sections):
+        return None
+
+    result = []
+    for part in parts:
+        pieces = part.split("␟")
+        if len(pieces) != 2:
+            return None
+        result.append({"title": pieces[0].strip(), "content": pieces[1].strip()})
+    return result
+
+def _render_section_body(section, highlight_texts, article_id, context):
+    """Render one section's content with highlights and the review UI"""
+    if st.session_state.show_reviews and highlight_texts:
+        section_content = apply_highlights_to_text(section["content"], highlight_texts)
+    else:
+        section_content = section["content"]
+
+    st.markdown(section_content, unsafe_allow_html=True)
+
+    if st.session_state.highlight_mode:
+        create_highlight_interface(section["content"], article_id, context)
+
+@_fragment
+def _render_section_lazy(section, highlight_texts, article_id, i):
+    """
+    Render a section lazily: the first (expanded) section loads right
+    away, collapsed ones defer highlight processing and markdown transfer
+    until the user asks for them. Runs as a fragment, so loading one
+    section reruns just that section rather than the whole article
+    """
+    loaded_key = f"section_loaded_{article_id}_{i}"
+    if i == 0 or st.session_state.get(loaded_key):
+        _render_section_body(section, highlight_texts, article_id, f"section_{i}")
+    elif st.button("Load section", key=f"load_{loaded_key}"):
+        st.session_state[loaded_key] = True
+        _render_section_body(section, highlight_texts, article_id, f"section_{i}")
 
 # Session state initialization
 if 'current_article' not in st.session_state:
@@ -167,6 +197,79 @@ if 'highlight_mode' not in st.session_state:
 if 'show_reviews' not in st.session_state:
     st.session_state.show_reviews = True
 
+def _rerun_app():
+    """Request a full-script rerun even from inside a fragment"""
+    if hasattr(st, "fragment"):
+        st.rerun(scope="app")
+    else:
+        st.rerun()
+
+@_fragment
+def _review_toggle():
+    """Review-visibility toggle, isolated so flips rerun only this block"""
+    show_reviews_toggle = st.toggle(
+        "Show community reviews",
+        value=st.session_state.show_reviews,
+        help="Toggle visibility of text marked for review by the community"
+    )
+
+    if show_reviews_toggle != st.session_state.show_reviews:
+        st.session_state.show_reviews = show_reviews_toggle
+        # The article body lives in a separate fragment, so escalate to
+        # a full rerun only when the value actually changed
+        _rerun_app()
+
+@_fragment
+def _highlight_toggle():
+    """Review-mode toggle and its help text, isolated as a fragment"""
+    highlight_toggle = st.toggle("Enable Review Mode", value=st.session_state.highlight_mode)
+    if highlight_toggle != st.session_state.highlight_mode:
+        st.session_state.highlight_mode = highlight_toggle
+        _rerun_app()
+
+    if st.session_state.highlight_mode:
+        st.markdown("""
+        <div class="highlight-instructions">
+            <b style="font-size: 1rem;">How to mark text for review:</b><br>
+            1. Copy text from the article you want to review<br>
+            2. Paste it in the "Part for review" box<br>
+            3. Click 'Mark for Review'<br>
+            4. Marked sections will be visible to all users
+        </div>
+        """, unsafe_allow_html=True)
+
+@_fragment
+def _render_search_results(results):
+    """
+    Search-result tag buttons, isolated as a fragment so unrelated
+    interactions elsewhere don't rebuild one button widget per result
+    """
+    cols = st.columns(2)
+
+    # Display each result as a clickable button styled as a tag
+    for idx, result in enumerate(results):
+        with cols[idx % 2]:  # Distribute results across 2 columns for better visibility
+            # Custom button style with more padding and distinctive appearance
+            if st.button(f"🏷️ {result}", key=f"result_{idx}", use_container_width=True):
+                with st.spinner(f"Loading article: {result}..."):
+                    st.session_state.current_article = get_article_content(result, st.session_state.current_language)
+                    if st.session_state.current_article:
+                        st.session_state.available_languages = get_available_languages(
+                            result,
+                            st.session_state.current_language
+                        )
+                        st.session_state.show_translation = False
+                        # Warm the cache for the most likely language
+                        # switches so a later switch is a cache hit
+                        # instead of a foreground round-trip
+                        prefetch_articles(
+                            st.session_state.available_languages,
+                            (st.session_state.translate_to, "en"),
+                            st.session_state.current_language
+                        )
+                        # The article renders outside this fragment
+                        _rerun_app()
+
 # Title and description
 st.markdown('<div class="main-header">WikiTruth</div>', unsafe_allow_html=True)
 st.markdown('<div class="subheader">Multilingual Wikipedia Search & Translation</div>', unsafe_allow_html=True)
@@ -175,109 +278,63 @@ st.markdown('<div class="subheader">Multilingual Wikipedia Search & Translation<
 with st.sidebar:
     st.subheader("Search Wikipedia")
     
-    # Language selection for search
-    search_lang = st.selectbox(
-        "Search Language", 
-        options=list(LANGUAGE_DICT.keys()),
-        format_func=lambda x: f"{get_language_name(x)} ({x})"
-    )
-    
-    # Search box
-    search_query = st.text_input("Enter your search query", key="search_box")
-    
-    if st.button("Search"):
-        if search_query:
-            with st.spinner(f"Searching Wikipedia in {get_language_name(search_lang)}..."):
-                st.session_state.search_results = get_wikipedia_search_results(search_query, search_lang)
-                st.session_state.current_article = None
-                st.session_state.available_languages = {}
-                st.session_state.current_language = search_lang
-                st.session_state.show_translation = False
+    # Language and query live in a form: edits inside it don't rerun the
+    # script, and the network search fires only on an explicit submit
+    with st.form("search_form", clear_on_submit=False):
+        # Language selection for search
+        search_lang = st.selectbox(
+            "Search Language",
+            options=list(LANGUAGE_DICT.keys()),
+            format_func=lambda x: f"{get_language_name(x)} ({x})"
+        )
+
+        # Search box
+        search_query = st.text_input("Enter your search query", key="search_box")
+
+        submitted = st.form_submit_button("Search")
+
+    if submitted and search_query:
+        with st.spinner(f"Searching Wikipedia in {get_language_name(search_lang)}..."):
+            st.session_state.search_results = get_wikipedia_search_results(search_query, search_lang)
+            st.session_state.current_article = None
+            st.session_state.available_languages = {}
+            st.session_state.current_language = search_lang
+            st.session_state.show_translation = False
     
     # Show search results if available
     if st.session_state.search_results:
         st.markdown("### 🔍 Search Results")
         
-        # Add a styled container for search results
-        st.markdown('<div style="background-color: #E3F2FD; padding: 15px; border-radius: 8px; border: 1px solid #BBDEFB;">', 
-                   unsafe_allow_html=True)
-        
-        # Use multiple columns to create a cleaner tag layout
-        cols = st.columns(2)
-        
-        # Display each result as a clickable button styled as a tag
-        for idx, result in enumerate(st.session_state.search_results):
-            with cols[idx % 2]:  # Distribute results across 2 columns for better visibility
-                # Custom button style with more padding and distinctive appearance
-                if st.button(f"🏷️ {result}", key=f"result_{idx}", use_container_width=True):
-                    with st.spinner(f"Loading article: {result}..."):
-                        st.session_state.current_article = get_article_content(result, st.session_state.current_language)
-                        if st.session_state.current_article:
-                            st.session_state.available_languages = get_available_languages(
-                                result, 
-                                st.session_state.current_language
-                            )
-                            st.session_state.show_translation = False
-                            st.rerun()
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+        # Styled container for search results
+        with _panel("panel-blue"):
+            _render_search_results(tuple(st.session_state.search_results))
     
     # Translation settings
     if st.session_state.current_article:
         st.markdown("### 🌐 Translation")
-        st.markdown('<div style="padding: 10px; background-color: #E8F5E9; border-radius: 5px; border: 1px solid #81C784;">',
-                  unsafe_allow_html=True)
-        st.session_state.translate_to = st.selectbox(
-            "Translate Article To",
-            options=list(LANGUAGE_DICT.keys()),
-            format_func=lambda x: f"{get_language_name(x)} ({x})",
-            key="translate_lang"
-        )
-        
-        if st.button("Translate Article", use_container_width=True):
-            st.session_state.show_translation = True
-            
-        st.markdown('</div>', unsafe_allow_html=True)
+        with _panel("panel-green"):
+            st.session_state.translate_to = st.selectbox(
+                "Translate Article To",
+                options=list(LANGUAGE_DICT.keys()),
+                format_func=lambda x: f"{get_language_name(x)} ({x})",
+                key="translate_lang"
+            )
+
+            if st.button("Translate Article", use_container_width=True):
+                st.session_state.show_translation = True
     
     # Review visibility toggle
     if st.session_state.current_article:
         st.markdown("### 👁️ Review Visibility")
-        st.markdown('<div style="padding: 10px; background-color: #F3E5F5; border-radius: 5px; border: 1px solid #CE93D8;">',
-                  unsafe_allow_html=True)
-        
-        show_reviews_toggle = st.toggle(
-            "Show community reviews", 
-            value=st.session_state.show_reviews,
-            help="Toggle visibility of text marked for review by the community"
-        )
-        
-        if show_reviews_toggle != st.session_state.show_reviews:
-            st.session_state.show_reviews = show_reviews_toggle
-            st.rerun()
-            
-        st.markdown('</div>', unsafe_allow_html=True)
-    
+        with _panel("panel-purple"):
+            _review_toggle()
+
     # Highlighting controls
     if st.session_state.current_article:
         st.markdown("### ✏️ Collaborative Review")
-        
-        highlight_toggle = st.toggle("Enable Review Mode", value=st.session_state.highlight_mode)
-        if highlight_toggle != st.session_state.highlight_mode:
-            st.session_state.highlight_mode = highlight_toggle
-            st.rerun()
-            
-        if st.session_state.highlight_mode:
-            st.markdown("""
-            <div style="background-color: #FFF9C4; color: #333333; padding: 12px; border-radius: 5px; 
-                        margin-bottom: 10px; font-size: 0.9rem; border: 1px solid #FBC02D;">
-                <b style="font-size: 1rem;">How to mark text for review:</b><br>
-                1. Copy text from the article you want to review<br>
-                2. Paste it in the "Part for review" box<br>
-                3. Click 'Mark for Review'<br>
-                4. Marked sections will be visible to all users
-            </div>
-            """, unsafe_allow_html=True)
-    
+
+        _highlight_toggle()
+
     st.markdown("""
     <div class="footer">
         TruePedia uses Wikipedia API and free translation libraries<br>
@@ -285,10 +342,290 @@ with st.sidebar:
     </div>
     """, unsafe_allow_html=True)
 
-# Main content area
-if st.session_state.current_article:
-    article = st.session_state.current_article
-    
+@_fragment
+def _render_summary_tab(article, article_id, highlight_texts):
+    """Render the summary tab: translated or original summary plus download"""
+    # Bind hot session values to locals once; proxy attribute reads
+    # go through a dict-and-dirty-tracking chain on every access
+    state = st.session_state
+    translate_to = state.translate_to
+    current_language = state.current_language
+    # If translation is requested, show translated summary
+    if state.show_translation and translate_to and translate_to != current_language:
+        # Stream the translation into a placeholder: the first chunks
+        # are readable while the rest are still in flight, then the
+        # same slot is swapped for the styled, highlighted final render
+        summary_slot = st.empty()
+        if hasattr(st, "write_stream"):
+            with summary_slot.container():
+                translated_summary = st.write_stream(
+                    translate_text_stream(article["summary"], translate_to, current_language)
+                )
+        else:
+            with st.spinner(f"Translating summary to {get_language_name(translate_to)}..."):
+                translated_summary = _translate_cached(
+                    article["summary"],
+                    translate_to,
+                    current_language
+                )
+
+        # Apply highlights if showing reviews is enabled
+        if state.show_reviews and highlight_texts:
+            highlighted_text = apply_highlights_to_text(translated_summary, highlight_texts)
+        else:
+            highlighted_text = translated_summary
+
+        # Show the text
+        summary_slot.markdown(f'<div class="article-summary">{highlighted_text}</div>', unsafe_allow_html=True)
+
+        # Add highlighting interface if needed
+        if state.highlight_mode:
+            create_highlight_interface(translated_summary, article_id, "summary")
+
+        # Create translated article object for document generation
+        translated_article = {
+            "title": article["title"] + f" (Translated to {get_language_name(translate_to)})",
+            "summary": translated_summary,
+            "content": translated_summary,  # Using summary as content since we're in summary tab
+            "url": article["url"]
+        }
+
+        # Create download button for translated summary
+        translated_filename = get_download_filename(
+            article["title"],
+            True,
+            translate_to
+        )
+
+        # Create document for download
+        doc_buffer = create_wiki_document(
+            translated_article,
+            get_language_name(current_language),
+            True,
+            get_language_name(translate_to)
+        )
+
+        # Add download button for translated content
+        st.markdown('<div class="download-btn-container">', unsafe_allow_html=True)
+        st.download_button(
+            label="📄 Download Translated Summary",
+            data=doc_buffer,
+            file_name=translated_filename,
+            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            key="download_translated_summary"
+        )
+        st.markdown('</div>', unsafe_allow_html=True)
+    else:
+        # Apply highlights if showing reviews is enabled
+        if state.show_reviews and highlight_texts:
+            highlighted_text = apply_highlights_to_text(article["summary"], highlight_texts)
+        else:
+            highlighted_text = article["summary"]
+
+        # Show the text
+        st.markdown(f'<div class="article-summary">{highlighted_text}</div>', unsafe_allow_html=True)
+
+        # Add highlighting interface if needed
+        if state.highlight_mode:
+            create_highlight_interface(article["summary"], article_id, "summary")
+
+        # Create document for download
+        doc_filename = get_download_filename(article["title"])
+        doc_buffer = create_wiki_document(
+            article,
+            get_language_name(current_language)
+        )
+
+        # Add download button for original content
+        st.markdown('<div class="download-btn-container">', unsafe_allow_html=True)
+        st.download_button(
+            label="📄 Download Article",
+            data=doc_buffer,
+            file_name=doc_filename,
+            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            key="download_original_summary"
+        )
+        st.markdown('</div>', unsafe_allow_html=True)
+
+@_fragment
+def _render_content_tab(article, article_id, highlight_texts):
+    """Render the full-content tab: sections, translation, and download"""
+    # Bind hot session values to locals once; proxy attribute reads
+    # go through a dict-and-dirty-tracking chain on every access
+    state = st.session_state
+    translate_to = state.translate_to
+    current_language = state.current_language
+    # Split the content into sections once for both branches (cached, so
+    # reruns over the same article reuse the parse)
+    original_sections = split_content_into_sections(article["content"])
+
+    # Make article content collapsible in sections
+    if state.show_translation and translate_to and translate_to != current_language:
+        with st.spinner(f"Translating content to {get_language_name(translate_to)}..."):
+            # Try one batched call first: every title and content in a
+            # single round-trip behind the surrounding spinner
+            translated_sections = _translate_sections_batched(
+                original_sections,
+                translate_to,
+                current_language
+            )
+
+            if translated_sections is not None:
+                # One batched call: every section is already translated,
+                # so render them eagerly in order
+                for i, section in enumerate(translated_sections):
+                    with st.expander(section["title"], expanded=(i == 0)):
+                        _render_section_body(section, highlight_texts, article_id, f"section_{i}")
+            else:
+                # Separators didn't survive; translate per section
+                # concurrently instead, streaming each section into a
+                # pre-created placeholder the moment it lands so the
+                # first sections are readable while the rest finish
+                section_progress = st.progress(0)
+                section_text = st.empty()
+                section_text.text("Preparing to translate sections...")
+                placeholders = [st.empty() for _ in original_sections]
+
+                # Sections render the moment they land, but the progress
+                # widgets are throttled to ~5 updates/sec so their
+                # websocket frames don't compete with the content
+                last_progress_update = 0.0
+
+                def _on_section_done(done, total, index, section):
+                    nonlocal last_progress_update
+                    with placeholders[index].container():
+                        with st.expander(section["title"], expanded=(index == 0)):
+                            _render_section_body(section, highlight_texts, article_id, f"section_{index}")
+                    now = time.monotonic()
+                    if done == total or now - last_progress_update > 0.2:
+                        last_progress_update = now
+                        section_progress.progress(done / total)
+                        section_text.text(f"Translated section {done}/{total}: {section['title']}")
+
+                translated_sections = asyncio.run(_translate_sections_async(
+                    original_sections,
+                    translate_to,
+                    current_language,
+                    _on_section_done
+                ))
+
+                # Clear progress indicators
+                section_progress.empty()
+                section_text.empty()
+
+            # Create translated article object for document generation
+            translated_article = {
+                "title": article["title"] + f" (Translated to {get_language_name(translate_to)})",
+                "summary": "",
+                "content": "",
+                "url": article["url"]
+            }
+
+            # Combine all translated content
+            for section in translated_sections:
+                translated_article["content"] += section["title"] + "\n\n" + section["content"] + "\n\n"
+
+            # Create download button for translated content
+            translated_filename = get_download_filename(
+                article["title"], 
+                True, 
+                translate_to
+            )
+
+            # Create document for download
+            doc_buffer = create_wiki_document(
+                translated_article,
+                get_language_name(current_language),
+                True,
+                get_language_name(translate_to)
+            )
+
+            # Add download button for translated content
+            st.markdown('<div class="download-btn-container">', unsafe_allow_html=True)
+            st.download_button(
+                label="📄 Download Translated Article",
+                data=doc_buffer,
+                file_name=translated_filename,
+                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                key="download_translated_content"
+            )
+            st.markdown('</div>', unsafe_allow_html=True)
+    else:
+        sections = original_sections
+
+        # Only the expanded first section is processed up front;
+        # collapsed sections load on demand so first paint doesn't pay
+        # for content the user may never open
+        for i, section in enumerate(sections):
+            with st.expander(section["title"], expanded=(i == 0)):
+                _render_section_lazy(section, highlight_texts, article_id, i)
+
+        # Create document for download
+        doc_filename = get_download_filename(article["title"])
+        doc_buffer = create_wiki_document(
+            article,
+            get_language_name(current_language)
+        )
+
+        # Add download button for original content
+        st.markdown('<div class="download-btn-container">', unsafe_allow_html=True)
+        st.download_button(
+            label="📄 Download Article",
+            data=doc_buffer,
+            file_name=doc_filename,
+            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            key="download_original_content"
+        )
+        st.markdown('</div>', unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def _build_language_options(available_languages):
+    """
+    Build the sorted language dropdown options and a code -> index map
+
+    Cached on the available-languages dict so the name lookups, display
+    string formatting and sort run once per article rather than on every
+    rerun; the index map replaces a linear scan for the current language.
+
+    Args:
+        available_languages (dict): Language code -> article title map
+
+    Returns:
+        tuple: (options list of (code, title, display) tuples sorted by
+        display name, dict mapping code -> position in that list)
+    """
+    options = []
+    for lang_code, lang_title in available_languages.items():
+        # Precomputed label for known languages; Wikipedia lists many
+        # more, so fall back to building the label for the rest
+        display_name = LANGUAGE_LABELS.get(lang_code)
+        if display_name is None:
+            native_name = get_native_language_name(lang_code)
+            display_name = f"{native_name} - {get_language_name(lang_code)} ({lang_code})"
+        options.append((lang_code, lang_title, display_name))
+
+    options.sort(key=lambda x: x[2])
+    index_by_code = {code: i for i, (code, _, _) in enumerate(options)}
+    return options, index_by_code
+
+@_fragment
+def _render_article(article):
+    """Render the full article view: header, languages, and both tabs"""
+    # Article identifier for highlights, computed once per rerun; the
+    # legacy "title_lang" key keeps pre-hashing highlights visible
+    article_id = make_article_id(article["title"], st.session_state.current_language)
+    legacy_article_id = f"{article['title']}_{st.session_state.current_language}"
+
+    # Fetch highlights once per rerun and pass them to both tabs instead
+    # of re-reading storage at every call site; when reviews are hidden
+    # the read is skipped entirely rather than fetched and discarded
+    if st.session_state.show_reviews:
+        highlights = get_highlights(article_id, legacy_article_id)
+        # Sorted once here rather than inside every per-section apply call
+        highlight_texts = prepare_highlight_texts(highlights)
+    else:
+        highlight_texts = ()
+
     # Display article title and summary
     st.markdown(f'<div class="article-title">{article["title"]}</div>', unsafe_allow_html=True)
     
@@ -300,27 +637,19 @@ if st.session_state.current_article:
         # Group languages by region/script for better organization
         st.write("Select a language to view this article in:")
         
-        # Create a selectbox with native language names
-        # Get the list of available languages with their native names
-        language_options = []
-        for lang_code, lang_title in st.session_state.available_languages.items():
-            native_name = get_native_language_name(lang_code)
-            display_name = f"{native_name} - {get_language_name(lang_code)} ({lang_code})"
-            language_options.append((lang_code, lang_title, display_name))
-        
-        # Sort by display name
-        language_options.sort(key=lambda x: x[2])
-        
+        # Create a selectbox with native language names, built and sorted
+        # once per article instead of on every rerun
+        language_options, index_by_code = _build_language_options(
+            st.session_state.available_languages
+        )
+
         # Create the dropdown
         if 'selected_language' not in st.session_state:
             st.session_state.selected_language = st.session_state.current_language
-            
-        selected_lang_index = 0
-        for i, (code, _, _) in enumerate(language_options):
-            if code == st.session_state.current_language:
-                selected_lang_index = i
-                break
-                
+
+        selected_lang_index = index_by_code.get(st.session_state.current_language, 0)
+
+
         selected_option = st.selectbox(
             "Choose Language",
             options=range(len(language_options)),
@@ -336,248 +665,26 @@ if st.session_state.current_article:
                 st.session_state.current_article = get_article_in_language(lang_title, lang_code)
                 st.session_state.current_language = lang_code
                 st.session_state.show_translation = False
+                # Full-script rerun (st.rerun defaults to scope="app")
+                # on purpose: _render_article's article argument was
+                # bound when the fragment was registered, so a
+                # fragment-scoped rerun would redisplay the old article
                 st.rerun()
     
-    # Create tabs for summary and full content
+    # Create tabs for summary and full content; each body runs as its
+    # own fragment so interacting inside one tab does not re-render the
+    # other
     summary_tab, content_tab = st.tabs(["Summary", "Full Content"])
-    
+
     with summary_tab:
-        # Get article ID for highlights
-        article_id = f"{article['title']}_{st.session_state.current_language}"
-        highlights = get_highlights(article_id)
-        
-        # If translation is requested, show translated summary
-        if st.session_state.show_translation and st.session_state.translate_to != st.session_state.current_language:
-            with st.spinner(f"Translating summary to {get_language_name(st.session_state.translate_to)}..."):
-                translated_summary = translate_text(
-                    article["summary"],
-                    st.session_state.translate_to,
-                    st.session_state.current_language
-                )
-                
-                # Apply highlights if showing reviews is enabled
-                if st.session_state.show_reviews and highlights:
-                    highlighted_text = apply_highlights_to_text(translated_summary, highlights)
-                else:
-                    highlighted_text = translated_summary
-                
-                # Show the text
-                st.markdown(f'<div class="article-summary">{highlighted_text}</div>', unsafe_allow_html=True)
-                
-                # Add highlighting interface if needed
-                if st.session_state.highlight_mode:
-                    create_highlight_interface(translated_summary, article_id, "summary")
-                
-                # Create translated article object for document generation
-                translated_article = {
-                    "title": article["title"] + f" (Translated to {get_language_name(st.session_state.translate_to)})",
-                    "summary": translated_summary,
-                    "content": translated_summary,  # Using summary as content since we're in summary tab
-                    "url": article["url"]
-                }
-                
-                # Create download button for translated summary
-                translated_filename = get_download_filename(
-                    article["title"], 
-                    True, 
-                    st.session_state.translate_to
-                )
-                
-                # Create document for download
-                doc_buffer = create_wiki_document(
-                    translated_article,
-                    get_language_name(st.session_state.current_language),
-                    True,
-                    get_language_name(st.session_state.translate_to)
-                )
-                
-                # Add download button for translated content
-                st.markdown('<div class="download-btn-container">', unsafe_allow_html=True)
-                st.download_button(
-                    label="📄 Download Translated Summary",
-                    data=doc_buffer,
-                    file_name=translated_filename,
-                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    key="download_translated_summary"
-                )
-                st.markdown('</div>', unsafe_allow_html=True)
-        else:
-            # Apply highlights if showing reviews is enabled
-            if st.session_state.show_reviews and highlights:
-                highlighted_text = apply_highlights_to_text(article["summary"], highlights)
-            else:
-                highlighted_text = article["summary"]
-            
-            # Show the text
-            st.markdown(f'<div class="article-summary">{highlighted_text}</div>', unsafe_allow_html=True)
-            
-            # Add highlighting interface if needed
-            if st.session_state.highlight_mode:
-                create_highlight_interface(article["summary"], article_id, "summary")
-                
-            # Create document for download
-            doc_filename = get_download_filename(article["title"])
-            doc_buffer = create_wiki_document(
-                article,
-                get_language_name(st.session_state.current_language)
-            )
-            
-            # Add download button for original content
-            st.markdown('<div class="download-btn-container">', unsafe_allow_html=True)
-            st.download_button(
-                label="📄 Download Article",
-                data=doc_buffer,
-                file_name=doc_filename,
-                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                key="download_original_summary"
-            )
-            st.markdown('</div>', unsafe_allow_html=True)
-    
+        _render_summary_tab(article, article_id, highlight_texts)
+
     with content_tab:
-        # Article ID for highlighting
-        article_id = f"{article['title']}_{st.session_state.current_language}"
-        
-        # Make article content collapsible in sections
-        if st.session_state.show_translation and st.session_state.translate_to != st.session_state.current_language:
-            with st.spinner(f"Translating content to {get_language_name(st.session_state.translate_to)}..."):
-                # Split the content into sections first for better handling of large texts
-                original_sections = split_content_into_sections(article["content"])
-                
-                translated_sections = []
-                
-                # Create a progress bar for section translation
-                section_progress = st.progress(0)
-                section_text = st.empty()
-                section_text.text("Preparing to translate sections...")
-                
-                # Translate each section separately (smaller chunks are easier to handle)
-                for i, section in enumerate(original_sections):
-                    section_text.text(f"Translating section {i+1}/{len(original_sections)}: {section['title']}")
-                    
-                    # Update progress
-                    section_progress.progress((i) / len(original_sections))
-                    
-                    # Translate the section title and content
-                    translated_title = translate_text(
-                        section["title"],
-                        st.session_state.translate_to,
-                        st.session_state.current_language
-                    )
-                    
-                    translated_content = translate_text(
-                        section["content"],
-                        st.session_state.translate_to,
-                        st.session_state.current_language
-                    )
-                    
-                    # Add to our list of translated sections
-                    translated_sections.append({
-                        "title": translated_title,
-                        "content": translated_content
-                    })
-                    
-                    # Update progress after section is complete
-                    section_progress.progress((i+1) / len(original_sections))
-                
-                # Clear progress indicators
-                section_progress.empty()
-                section_text.empty()
-                
-                # Use the translated sections directly
-                sections = translated_sections
-                
-                # Get highlights
-                highlights = get_highlights(article_id)
-                
-                # For each section, apply highlights if showing reviews is enabled
-                for i, section in enumerate(sections):
-                    with st.expander(section["title"], expanded=(i == 0)):
-                        # Apply highlights if showing reviews is enabled
-                        if st.session_state.show_reviews and highlights:
-                            section_content = apply_highlights_to_text(section["content"], highlights)
-                        else:
-                            section_content = section["content"]
-                            
-                        st.markdown(section_content, unsafe_allow_html=True)
-                        
-                        if st.session_state.highlight_mode:
-                            create_highlight_interface(section["content"], article_id, f"section_{i}")
-                
-                # Create translated article object for document generation
-                translated_article = {
-                    "title": article["title"] + f" (Translated to {get_language_name(st.session_state.translate_to)})",
-                    "summary": "",
-                    "content": "",
-                    "url": article["url"]
-                }
-                
-                # Combine all translated content
-                for section in translated_sections:
-                    translated_article["content"] += section["title"] + "\n\n" + section["content"] + "\n\n"
-                
-                # Create download button for translated content
-                translated_filename = get_download_filename(
-                    article["title"], 
-                    True, 
-                    st.session_state.translate_to
-                )
-                
-                # Create document for download
-                doc_buffer = create_wiki_document(
-                    translated_article,
-                    get_language_name(st.session_state.current_language),
-                    True,
-                    get_language_name(st.session_state.translate_to)
-                )
-                
-                # Add download button for translated content
-                st.markdown('<div class="download-btn-container">', unsafe_allow_html=True)
-                st.download_button(
-                    label="📄 Download Translated Article",
-                    data=doc_buffer,
-                    file_name=translated_filename,
-                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    key="download_translated_content"
-                )
-                st.markdown('</div>', unsafe_allow_html=True)
-        else:
-            # Split content into sections for collapsible viewing
-            sections = split_content_into_sections(article["content"])
-            
-            # Get highlights
-            highlights = get_highlights(article_id)
-            
-            # For each section, apply highlights if showing reviews is enabled
-            for i, section in enumerate(sections):
-                with st.expander(section["title"], expanded=(i == 0)):
-                    # Apply highlights if showing reviews is enabled
-                    if st.session_state.show_reviews and highlights:
-                        section_content = apply_highlights_to_text(section["content"], highlights)
-                    else:
-                        section_content = section["content"]
-                        
-                    st.markdown(section_content, unsafe_allow_html=True)
-                    
-                    if st.session_state.highlight_mode:
-                        create_highlight_interface(section["content"], article_id, f"section_{i}")
-            
-            # Create document for download
-            doc_filename = get_download_filename(article["title"])
-            doc_buffer = create_wiki_document(
-                article,
-                get_language_name(st.session_state.current_language)
-            )
-            
-            # Add download button for original content
-            st.markdown('<div class="download-btn-container">', unsafe_allow_html=True)
-            st.download_button(
-                label="📄 Download Article",
-                data=doc_buffer,
-                file_name=doc_filename,
-                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                key="download_original_content"
-            )
-            st.markdown('</div>', unsafe_allow_html=True)
+        _render_content_tab(article, article_id, highlight_texts)
+
+# Main content area
+if st.session_state.current_article:
+    _render_article(st.session_state.current_article)
 else:
     # Welcome message when no article is selected
     st.info("👈 Search for a Wikipedia article in any language to get started!")
@@ -1,39 +1,83 @@
 import streamlit as st
+import asyncio
+import hashlib
+import os
 import time
 import re
-import threading
 import urllib.parse
 import requests
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from requests.adapters import HTTPAdapter, Retry
+
+import cache
+# Language tables live in their own module; re-exported here so callers
+# can keep importing them from wiki_utils
+from languages import (
+    LANGUAGE_DICT,
+    NATIVE_LANGUAGE_DICT,
+    LANGUAGE_LABELS,
+    get_language_name,
+    get_native_language_name,
+)
+
+# One pooled session for all outbound calls: the TCP+TLS handshake is
+# paid once per host and keep-alive connections are reused across every
+# Wikipedia and translation request from this process
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "WikiTruth/1.0"
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
 
 # Simple translation function without external dependencies
+@st.cache_data(ttl=3600, max_entries=2048, show_spinner=False)
 def basic_translate(text, to_lang, from_lang='auto'):
-    """Basic translation using free web API"""
+    """
+    Basic translation using free web API
+
+    Memoized per session, so the same text is never sent twice across
+    Streamlit reruns. Network errors propagate to the caller rather
+    than being reported here, so a cached replay can't swallow them.
+    """
     if not text or not text.strip():
         return text
-        
-    try:
-        # Using Google Translate API for public use (free tier)
-        fallback_url = f"https://translate.googleapis.com/translate_a/single?client=gtx&sl={from_lang}&tl={to_lang}&dt=t&q={urllib.parse.quote(text)}"
-        fallback_response = requests.get(fallback_url)
-        
-        if fallback_response.status_code == 200:
-            data = fallback_response.json()
-            if isinstance(data, list) and len(data) > 0 and isinstance(data[0], list):
-                translated = ''.join([sentence[0] for sentence in data[0] if isinstance(sentence, list) and len(sentence) > 0])
-                return translated
-            else:
-                # Fallback to direct text return
-                return text
+
+    # Identity translation is a no-op; don't pay a round-trip for it
+    if from_lang != 'auto' and from_lang == to_lang:
+        return text
+
+    # Using Google Translate API for public use (free tier); requests
+    # encodes the params itself, so no manual quote() pass over the
+    # text and no URL string to re-parse
+    fallback_response = _SESSION.get(
+        "https://translate.googleapis.com/translate_a/single",
+        params={
+            "client": "gtx",
+            "sl": from_lang,
+            "tl": to_lang,
+            "dt": "t",
+            "q": text
+        },
+        timeout=(3, 10)
+    )
+
+    if fallback_response.status_code == 200:
+        data = fallback_response.json()
+        if isinstance(data, list) and len(data) > 0 and isinstance(data[0], list):
+            translated = ''.join([sentence[0] for sentence in data[0] if isinstance(sentence, list) and len(sentence) > 0])
+            return translated
         else:
+            # Fallback to direct text return
             return text
-                
-    except Exception as e:
-        st.error(f"Translation error: {str(e)}")
+    else:
         return text
 
-@st.cache_data(ttl=3600)
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
 def get_wikipedia_search_results(query, language="en"):
     """
     Search Wikipedia for articles matching the query in specified language
@@ -60,7 +104,7 @@ def get_wikipedia_search_results(query, language="en"):
             "srlimit": 10
         }
         
-        response = requests.get(url, params=params)
+        response = _SESSION.get(url, params=params, timeout=(3, 10))
         data = response.json()
         
         # Extract titles from the search results
@@ -70,142 +114,247 @@ def get_wikipedia_search_results(query, language="en"):
         st.error(f"Error searching Wikipedia: {str(e)}")
         return []
 
-@st.cache_data(ttl=3600)
+# First "== Heading ==" line of a plain-text extract; everything before
+# it is the intro that prop=extracts&exintro used to fetch separately
+_FIRST_HEADING = re.compile(r'^==', re.MULTILINE)
+
+# Sentence boundaries for chunking, compiled once at import instead of
+# through re's cache lookup on every split
+_SENTENCE_ENDINGS = re.compile(r'(?<=[.!?])\s+')
+
+def _extract_intro(content):
+    """
+    Derive the intro (pre-first-heading) part of a plain-text extract
+
+    Args:
+        content (str): Full plain-text extract
+
+    Returns:
+        str: Text before the first section heading, or the whole extract
+        for pages without sections
+    """
+    match = _FIRST_HEADING.search(content)
+    if match:
+        return content[:match.start()].strip()
+    return content
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def _fetch_page_bundle(title, language):
+    """
+    Fetch extract, language links and canonical URL in one API call
+
+    Article content and available languages used to be separate requests
+    for the same page; one combined query means one TLS session, one
+    server-side parse and one response, and the cached bundle serves
+    both callers.
+
+    Args:
+        title (str): The title of the article
+        language (str): Language code (e.g., 'en', 'es', 'fr')
+
+    Returns:
+        dict: {"summary", "content", "url", "langlinks"} for the page,
+        or None if the page does not exist
+    """
+    url = f"https://{language}.wikipedia.org/w/api.php"
+    params = {
+        "action": "query",
+        "format": "json",
+        "titles": title,
+        "prop": "extracts|langlinks|info",
+        "explaintext": True,
+        "lllimit": 500,  # Get many language links
+        "inprop": "url"
+    }
+
+    response = _SESSION.get(url, params=params, timeout=(3, 10))
+    data = response.json()
+
+    pages = data.get("query", {}).get("pages", {})
+    if not pages:
+        return None
+
+    page_id = list(pages.keys())[0]
+    if page_id == "-1":  # Page not found
+        return None
+
+    page = pages[page_id]
+    content = page.get("extract", "No content available")
+
+    # Language codes mapped to the article's title in that language
+    langlinks = {language: title}
+    for lang in page.get("langlinks", []):
+        langlinks[lang["lang"]] = lang["*"]
+
+    # Canonical URL from inprop=url, built locally as a fallback;
+    # quote_from_bytes on a prepared byte buffer stays on the C path
+    # instead of quote's per-character str scan
+    article_url = page.get("fullurl")
+    if not article_url:
+        encoded_title = urllib.parse.quote_from_bytes(
+            title.encode('utf-8').replace(b' ', b'_')
+        )
+        article_url = f"https://{language}.wikipedia.org/wiki/{encoded_title}"
+
+    return {
+        "summary": _extract_intro(content) or "No summary available",
+        "content": content,
+        "url": article_url,
+        "langlinks": langlinks
+    }
+
 def get_article_content(title, language="en"):
     """
     Get the content of a Wikipedia article using the MediaWiki API directly
-    
+
     Args:
         title (str): The title of the article
         language (str): Language code (e.g., 'en', 'es', 'fr')
-        
+
     Returns:
         dict: Dictionary containing article title, summary, content and URL
     """
     if not title:
         return None
-    
+
     try:
-        # Use Wikipedia's API directly via requests
-        url = f"https://{language}.wikipedia.org/w/api.php"
-        
-        # First get the summary (extracts)
-        summary_params = {
-            "action": "query",
-            "format": "json",
-            "titles": title,
-            "prop": "extracts",
-            "exintro": True,
-            "explaintext": True
-        }
-        
-        summary_response = requests.get(url, params=summary_params)
-        summary_data = summary_response.json()
-        
-        # Extract page ID and summary
-        pages = summary_data.get("query", {}).get("pages", {})
-        page_id = list(pages.keys())[0]
-        
-        if page_id == "-1":  # Page not found
+        bundle = _fetch_page_bundle(title, language)
+        if bundle is None:
             return None
-        
-        summary = pages[page_id].get("extract", "No summary available")
-        
-        # Now get the full content
-        content_params = {
-            "action": "query",
-            "format": "json",
-            "titles": title,
-            "prop": "extracts",
-            "explaintext": True
-        }
-        
-        content_response = requests.get(url, params=content_params)
-        content_data = content_response.json()
-        
-        # Extract full content
-        content_pages = content_data.get("query", {}).get("pages", {})
-        content = content_pages[page_id].get("extract", "No content available")
-        
-        # Create Wikipedia URL
-        encoded_title = urllib.parse.quote(title.replace(' ', '_'))
-        article_url = f"https://{language}.wikipedia.org/wiki/{encoded_title}"
-        
+
         return {
             "title": title,
-            "summary": summary,
-            "content": content,
-            "url": article_url
+            "summary": bundle["summary"],
+            "content": bundle["content"],
+            "url": bundle["url"]
         }
     except Exception as e:
         st.error(f"Error retrieving article: {str(e)}")
         return None
 
-@st.cache_data(ttl=3600)
 def get_available_languages(title, source_lang="en"):
     """
     Get available languages for a Wikipedia article using the MediaWiki API directly
-    
+
+    Served from the same cached page bundle as get_article_content, so
+    the typical search -> article -> languages flow makes one network
+    call, not three.
+
     Args:
         title (str): The title of the article
         source_lang (str): Source language code
-        
+
     Returns:
         dict: Dictionary of language codes and titles
     """
     if not title:
         return {}
-    
+
     try:
-        # Use Wikipedia's API directly via requests
-        url = f"https://{source_lang}.wikipedia.org/w/api.php"
-        params = {
-            "action": "query",
-            "format": "json",
-            "titles": title,
-            "prop": "langlinks",
-            "lllimit": 500  # Get many language links
-        }
-        
-        response = requests.get(url, params=params)
-        data = response.json()
-        
-        # Extract language links
-        pages = data.get("query", {}).get("pages", {})
-        if not pages:
-            return {source_lang: title}
-            
-        page_id = list(pages.keys())[0]
-        
-        if page_id == "-1":  # Page not found
+        bundle = _fetch_page_bundle(title, source_lang)
+        if bundle is None:
             return {source_lang: title}
-            
-        langlinks = pages[page_id].get("langlinks", [])
-        
-        # Create a dictionary of language codes and titles
-        available_langs = {source_lang: title}
-        for lang in langlinks:
-            available_langs[lang["lang"]] = lang["*"]
-        
-        return available_langs
+
+        return dict(bundle["langlinks"])
     except Exception as e:
         st.error(f"Error retrieving language versions: {str(e)}")
         # Return at least the source language
         return {source_lang: title}
 
-@st.cache_data(ttl=3600)
-def get_article_in_language(title, lang):
+# Alias kept for callers; fetching by (title, lang) is exactly what
+# get_article_content does, and a separately cached wrapper would hold
+# a second copy of every article in Streamlit's memo
+get_article_in_language = get_article_content
+
+async def _fetch_bundles_async(titles_by_lang):
     """
-    Get article content in the specified language
-    
+    Fetch several language versions of an article concurrently
+
     Args:
-        title (str): Title of the article in the specified language
-        lang (str): Language code
-        
+        titles_by_lang (dict): Language code -> article title map
+
     Returns:
-        dict: Article content in the specified language
+        dict: Language code -> page bundle (None for missing pages or
+        failed fetches)
+    """
+    loop = asyncio.get_running_loop()
+
+    async def _one(lang, title):
+        try:
+            bundle = await loop.run_in_executor(
+                _TRANSLATE_EXECUTOR, _fetch_page_bundle, title, lang
+            )
+        except Exception:
+            bundle = None
+        return lang, bundle
+
+    results = await asyncio.gather(
+        *[_one(lang, title) for lang, title in titles_by_lang.items()]
+    )
+    return dict(results)
+
+def fetch_many_articles(titles_by_lang):
     """
-    return get_article_content(title, lang)
+    Fetch article bundles for several languages in one concurrent pass
+
+    Iterating get_available_languages and fetching each title serially
+    costs N round-trips end to end; here the fetches fan out over the
+    shared worker pool and pooled session, so wall-clock time is bounded
+    by the slowest response. Every bundle also lands in the page-bundle
+    cache for later single-article calls.
+
+    Args:
+        titles_by_lang (dict): Language code -> article title map
+
+    Returns:
+        dict: Language code -> page bundle, None where the fetch failed
+    """
+    if not titles_by_lang:
+        return {}
+    return asyncio.run(_fetch_bundles_async(titles_by_lang))
+
+# Small pool for speculative page fetches; kept separate from the
+# translation workers so prefetches never delay a translation the user
+# is actually waiting on
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+
+# How many sibling-language articles to fetch speculatively
+_PREFETCH_LIMIT = 2
+
+def _prefetch_bundle(title, language):
+    """Warm the page-bundle cache; failures are silently dropped"""
+    try:
+        _fetch_page_bundle(title, language)
+    except Exception:
+        pass
+
+def prefetch_articles(available_languages, preferred_langs, current_language):
+    """
+    Speculatively fetch the article in languages the user is likely to
+    switch to
+
+    Runs in background threads right after an article opens, so a later
+    language switch is served from the cached page bundle instead of
+    paying a foreground round-trip. Best effort: misses and errors cost
+    nothing visible.
+
+    Args:
+        available_languages (dict): Language code -> article title map
+        preferred_langs (iterable): Language codes in priority order;
+            falsy entries are skipped
+        current_language (str): Language already on screen
+    """
+    submitted = 0
+    for lang_code in preferred_langs:
+        if submitted >= _PREFETCH_LIMIT:
+            break
+        if not lang_code or lang_code == current_language:
+            continue
+        title = available_languages.get(lang_code)
+        if not title:
+            continue
+        _PREFETCH_EXECUTOR.submit(_prefetch_bundle, title, lang_code)
+        submitted += 1
 
 def split_text_into_chunks(text, chunk_size=800):
     """
@@ -222,277 +371,468 @@ def split_text_into_chunks(text, chunk_size=800):
     if not text:
         return []
     
-    # Regular expression to find sentence boundaries
-    sentence_endings = r'(?<=[.!?])\s+'
-    sentences = re.split(sentence_endings, text)
+    # Split at sentence boundaries with the precompiled pattern
+    sentences = _SENTENCE_ENDINGS.split(text)
     
+    # Accumulate parts in lists and join on flush; growing a string with
+    # += is quadratic once the buffer escapes, and article text is large.
+    # The tracked lengths count each part plus its trailing space, same
+    # as the old string buffers
     chunks = []
-    current_chunk = ""
-    
+    current_parts = []
+    current_len = 0
+
+    def flush(parts):
+        joined = ' '.join(parts).strip()
+        if joined:
+            chunks.append(joined)
+
     for sentence in sentences:
         # If this sentence alone is bigger than chunk_size, split it by spaces
         if len(sentence) > chunk_size:
             words = sentence.split()
-            temp_chunk = ""
-            for word in words:
-                if len(temp_chunk) + len(word) + 1 > chunk_size:
-                    chunks.append(temp_chunk.strip())
-                    temp_chunk = word + " "
+            # Prefix sums over word costs (length plus trailing space)
+            # let bisect find each cut point in C instead of a Python
+            # test per word; each group is the longest word run whose
+            # total cost stays within chunk_size
+            cum = list(accumulate(len(word) + 1 for word in words))
+            start = 0
+            while start < len(cum):
+                base = cum[start - 1] if start else 0
+                end = bisect_right(cum, base + chunk_size)
+                if end == start:
+                    # Single word longer than chunk_size gets its own group
+                    end = start + 1
+                if end < len(cum):
+                    flush(words[start:end])
                 else:
-                    temp_chunk += word + " "
-            
-            if temp_chunk.strip():
-                current_chunk += temp_chunk
+                    # The final group continues the current chunk
+                    current_parts.extend(words[start:])
+                    current_len += cum[-1] - base
+                start = end
         # If adding this sentence would exceed the chunk size,
         # add current chunk to the list and start a new one
-        elif len(current_chunk) + len(sentence) > chunk_size:
-            chunks.append(current_chunk.strip())
-            current_chunk = sentence + " "
+        elif current_len + len(sentence) > chunk_size:
+            flush(current_parts)
+            current_parts = [sentence]
+            current_len = len(sentence) + 1
         else:
-            current_chunk += sentence + " "
-    
+            current_parts.append(sentence)
+            current_len += len(sentence) + 1
+
     # Add the last chunk if it's not empty
-    if current_chunk.strip():
-        chunks.append(current_chunk.strip())
-    
+    flush(current_parts)
+
     return chunks
 
+def _translation_key(text, to_lang, from_lang):
+    """
+    Build the persistent-cache key for one piece of text
+
+    Args:
+        text (str): Source text
+        to_lang (str): Target language code
+        from_lang (str): Source language code
+
+    Returns:
+        str: Hex digest keyed on language pair and text; blake2b is the
+        fastest hash in hashlib and 16 bytes is plenty for a cache key
+    """
+    return hashlib.blake2b(
+        f"{from_lang}\x00{to_lang}\x00{text}".encode(), digest_size=16
+    ).hexdigest()
+
 def translate_chunk(chunk, to_lang, from_lang):
     """
     Translate a single chunk of text using the public translation API
-    
+
+    Checks the persistent cache first, so identical chunks from
+    revisited articles are a database read instead of an API call,
+    across sessions.
+
     Args:
         chunk (str): Text chunk to translate
         to_lang (str): Target language code
         from_lang (str): Source language code
-        
+
     Returns:
         str: Translated text
     """
     if not chunk or not chunk.strip():
         return ""
-    
+
+    cache_key = _translation_key(chunk, to_lang, from_lang)
+    cached = cache.get_cached_translation(cache_key, to_lang)
+    if cached is not None:
+        return cached
+
     try:
         # Use the basic translate function for each chunk
-        return basic_translate(chunk, to_lang, from_lang)
+        translated = basic_translate(chunk, to_lang, from_lang)
+        # basic_translate returns the input unchanged on failure; don't
+        # pin a failed lookup in the cache for a week
+        if translated != chunk:
+            cache.store_translation(cache_key, from_lang, to_lang, translated)
+        return translated
     except Exception as e:
         st.warning(f"Error translating chunk: {str(e)}")
         return chunk  # Return original chunk if translation fails
 
-# Thread-safe lock for translation
-translate_lock = threading.Lock()
+# Concurrency cap for translation requests. The work is I/O-bound, so
+# it is sized for endpoint latency rather than CPU count, and can be
+# tuned per deployment without a code change
+_TRANSLATE_WORKERS = max(1, int(os.environ.get("WIKITRUTH_TRANSLATE_WORKERS", "16")))
 
-def translate_text(text, to_lang, from_lang='auto'):
+# One long-lived worker pool shared by every translation call, instead
+# of creating and tearing down threads per call
+_TRANSLATE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_TRANSLATE_WORKERS,
+    thread_name_prefix="translate"
+)
+
+# Chunks are merged into super-batches up to this many characters, each
+# translated with a single POST instead of one request per chunk
+_BATCH_CHAR_LIMIT = 4000
+# Sentinel between chunks inside a batch; a "symbol for control
+# character" code point that never occurs in article text and passes
+# through the translator untouched
+_CHUNK_SEP = "\n␝\n"
+
+def _translate_chunk_batch(batch, to_lang, from_lang):
+    """
+    Translate several chunks with one POST to the translation endpoint
+
+    Args:
+        batch (list): Text chunks to translate together
+        to_lang (str): Target language code
+        from_lang (str): Source language code
+
+    Returns:
+        list: Translated chunks in order, or None when the response
+        could not be split back apart (caller falls back to per-chunk)
+    """
+    response = _SESSION.post(
+        "https://translate.googleapis.com/translate_a/single",
+        data={
+            "client": "gtx",
+            "sl": from_lang,
+            "tl": to_lang,
+            "dt": "t",
+            "q": _CHUNK_SEP.join(batch)
+        },
+        timeout=(3, 10)
+    )
+
+    if response.status_code != 200:
+        return None
+
+    data = response.json()
+    if not (isinstance(data, list) and len(data) > 0 and isinstance(data[0], list)):
+        return None
+
+    translated = ''.join([sentence[0] for sentence in data[0] if isinstance(sentence, list) and len(sentence) > 0])
+
+    # Split on the bare sentinel: surrounding whitespace may be reflowed
+    parts = translated.split("␝")
+    if len(parts) != len(batch):
+        return None
+    return [part.strip() for part in parts]
+
+def _group_chunks_into_batches(chunks):
+    """
+    Group chunks into super-batches bounded by _BATCH_CHAR_LIMIT
+
+    Args:
+        chunks (list): Text chunks in document order
+
+    Returns:
+        list: Lists of consecutive chunks, order preserved
+    """
+    batches = []
+    current = []
+    current_len = 0
+    for chunk in chunks:
+        if current and current_len + len(chunk) > _BATCH_CHAR_LIMIT:
+            batches.append(current)
+            current = []
+            current_len = 0
+        current.append(chunk)
+        current_len += len(chunk)
+    if current:
+        batches.append(current)
+    return batches
+
+def _translate_batch(batch, to_lang, from_lang):
+    """
+    Translate one super-batch, falling back to per-chunk requests
+
+    Args:
+        batch (list): Text chunks to translate
+        to_lang (str): Target language code
+        from_lang (str): Source language code
+
+    Returns:
+        list: Translated chunks in order
+    """
+    try:
+        result = _translate_chunk_batch(batch, to_lang, from_lang)
+        if result is not None:
+            return result
+    except Exception:
+        pass
+
+    # Batch POST failed or the sentinel didn't survive; translate the
+    # chunks of this batch individually
+    return [translate_chunk(chunk, to_lang, from_lang) for chunk in batch]
+
+async def _translate_batches_async(batches, to_lang, from_lang, on_progress=None):
+    """
+    Translate all super-batches concurrently with bounded parallelism
+
+    Each batch goes to the shared translation worker pool over the
+    pooled session and the results are gathered in order. The pool size
+    caps in-flight requests, and completions overlap freely instead of
+    serializing on a lock at the collection point.
+
+    Args:
+        batches (list): Lists of chunks from _group_chunks_into_batches
+        to_lang (str): Target language code
+        from_lang (str): Source language code
+        on_progress (callable, optional): Called with (done, total) from
+            the event-loop thread as each batch completes
+
+    Returns:
+        list: Translated batches in the original order
+    """
+    loop = asyncio.get_running_loop()
+    total = len(batches)
+    done = 0
+
+    async def _one(batch):
+        nonlocal done
+        result = await loop.run_in_executor(
+            _TRANSLATE_EXECUTOR, _translate_batch, batch, to_lang, from_lang
+        )
+        done += 1
+        if on_progress:
+            on_progress(done, total)
+        return result
+
+    return await asyncio.gather(*[_one(batch) for batch in batches])
+
+def translate_text(text, to_lang, from_lang='auto', show_progress=True):
     """
     Translate text using multithreaded approach for efficiency
-    
+
     Args:
         text (str): Text to translate
         to_lang (str): Target language code
         from_lang (str): Source language code
-        
+        show_progress (bool): Whether to render a Streamlit progress bar;
+            pass False when calling from a worker thread
+
     Returns:
         str: Translated text
     """
     if not text:
         return ""
-    
+
+    # Identity translations are a no-op: no target language, or target
+    # equals source
+    if not to_lang or to_lang == from_lang:
+        return text
+
+    # Persistent cache: the same text translated in any earlier session
+    # (or earlier in this one) is a database lookup, not an API call
+    cache_key = _translation_key(text, to_lang, from_lang)
+    cached = cache.get_cached_translation(cache_key, to_lang)
+    if cached is not None:
+        return cached
+
     try:
         # For very short texts, just translate directly without chunking
         if len(text) < 200:  # Reduced threshold to only skip chunking for very small texts
-            return basic_translate(text, to_lang, from_lang)
-            
+            translated = basic_translate(text, to_lang, from_lang)
+            # basic_translate returns the input unchanged on failure;
+            # don't pin a failed lookup in the cache for a week
+            if translated != text:
+                cache.store_translation(cache_key, from_lang, to_lang, translated)
+            return translated
+
         # Split text into smaller chunks for translation
         chunks = split_text_into_chunks(text)
-        
+
         if not chunks:
             return ""
-        
+
         # Create a progress bar
-        progress_bar = st.progress(0)
-        progress_text = st.empty()
-        progress_text.text("Translating...")
-        
-        # Create a thread pool for concurrent translation
-        translated_chunks = []
-        total_chunks = len(chunks)
-        
-        # Use more workers for faster translation
-        max_workers = min(12, total_chunks)
-        
-        # We'll use a dict to keep track of the original order
-        chunk_results = {}
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all translation tasks
-            future_to_chunk = {
-                executor.submit(translate_chunk, chunk, to_lang, from_lang): i 
-                for i, chunk in enumerate(chunks)
-            }
-            
-            # Process results as they complete
-            for i, future in enumerate(as_completed(future_to_chunk)):
-                chunk_index = future_to_chunk[future]
-                try:
-                    # Thread-safe translation
-                    with translate_lock:
-                        translated_text = future.result()
-                    
-                    # Store translated chunks (will sort by index later)
-                    chunk_results[chunk_index] = translated_text
-                    
-                    # Update progress
-                    progress = (i + 1) / total_chunks
-                    progress_bar.progress(progress)
-                    progress_text.text(f"Translating... {i+1}/{total_chunks} chunks complete")
-                    
-                except Exception as e:
-                    st.warning(f"Error with chunk {chunk_index}: {str(e)}")
-                    # Keep the original text for failed translations
-                    chunk_results[chunk_index] = chunks[chunk_index]
-        
-        # Sort chunks by their original index
-        sorted_chunks = [chunk_results.get(i, chunks[i]) for i in range(total_chunks)]
+        if show_progress:
+            progress_bar = st.progress(0)
+            progress_text = st.empty()
+            progress_text.text("Translating...")
+        
+        # Group chunks into super-batches, each translated with a single
+        # POST; a 20-chunk article becomes ~5 round-trips instead of 20
+        batches = _group_chunks_into_batches(chunks)
+
+        # Every progress update is a websocket frame to the browser;
+        # throttle to ~5/sec so UI traffic doesn't compete with the
+        # translation itself, but always show the final state
+        last_update = 0.0
+
+        def _on_batch_progress(done, total):
+            nonlocal last_update
+            if not show_progress:
+                return
+            now = time.monotonic()
+            if done < total and now - last_update < 0.2:
+                return
+            last_update = now
+            progress_bar.progress(done / total)
+            progress_text.text(f"Translating... {done}/{total} batches complete")
+
+        # Translate every batch concurrently; _translate_batch already
+        # degrades to per-chunk requests on failure, so results come
+        # back complete and in order
+        translated_batches = asyncio.run(
+            _translate_batches_async(batches, to_lang, from_lang, _on_batch_progress)
+        )
+
+        # Reassemble the chunks in their original order
+        sorted_chunks = []
+        for batch in translated_batches:
+            sorted_chunks.extend(batch)
         result = ' '.join(sorted_chunks)
         
         # Clear progress indicators
-        progress_bar.empty()
-        progress_text.empty()
-        
+        if show_progress:
+            progress_bar.empty()
+            progress_text.empty()
+
+        # A result identical to the input means every chunk fell back;
+        # don't pin that failure in the cache for a week
+        if result != text:
+            cache.store_translation(cache_key, from_lang, to_lang, result)
+
         return result
         
     except Exception as e:
         st.error(f"Translation error: {str(e)}")
         return text  # Return original text if translation fails
 
-# Dictionary mapping language codes to language names
-LANGUAGE_DICT = {
-    'en': 'English',
-    'es': 'Spanish',
-    'fr': 'French',
-    'de': 'German',
-    'it': 'Italian',
-    'pt': 'Portuguese',
-    'ru': 'Russian',
-    'ja': 'Japanese',
-    'zh': 'Chinese',
-    'ar': 'Arabic',
-    'hi': 'Hindi',
-    'ko': 'Korean',
-    'nl': 'Dutch',
-    'sv': 'Swedish',
-    'fi': 'Finnish',
-    'no': 'Norwegian',
-    'da': 'Danish',
-    'pl': 'Polish',
-    'uk': 'Ukrainian',
-    'el': 'Greek',
-    'he': 'Hebrew',
-    'id': 'Indonesian',
-    'vi': 'Vietnamese',
-    'fa': 'Persian',
-    'tr': 'Turkish',
-    'cs': 'Czech',
-    'hu': 'Hungarian',
-    'ro': 'Romanian',
-    'th': 'Thai'
-}
-
-# Dictionary mapping language codes to native language names
-NATIVE_LANGUAGE_DICT = {
-    'en': 'English',
-    'es': 'Español',
-    'fr': 'Français',
-    'de': 'Deutsch',
-    'it': 'Italiano',
-    'pt': 'Português',
-    'ru': 'Русский',
-    'ja': '日本語',
-    'zh': '中文',
-    'ar': 'العربية',
-    'hi': 'हिन्दी',
-    'ko': '한국어',
-    'nl': 'Nederlands',
-    'sv': 'Svenska',
-    'fi': 'Suomi',
-    'no': 'Norsk',
-    'da': 'Dansk',
-    'pl': 'Polski',
-    'uk': 'Українська',
-    'el': 'Ελληνικά',
-    'he': 'עברית',
-    'id': 'Bahasa Indonesia',
-    'vi': 'Tiếng Việt',
-    'fa': 'فارسی',
-    'tr': 'Türkçe',
-    'cs': 'Čeština',
-    'hu': 'Magyar',
-    'ro': 'Română',
-    'th': 'ไทย'
-}
-
-def get_language_name(lang_code):
-    """
-    Get the full language name from a language code
-    
-    Args:
-        lang_code (str): Language code (e.g., 'en', 'es')
-        
-    Returns:
-        str: Full language name
+def translate_text_stream(text, to_lang, from_lang='auto'):
     """
-    return LANGUAGE_DICT.get(lang_code, lang_code)
+    Translate text and yield it incrementally in document order
+
+    Generator counterpart to translate_text for st.write_stream: every
+    batch is submitted to the worker pool up front and results are
+    emitted in order as they finalize, so the first chunk is readable
+    after roughly one round-trip instead of after the slowest batch.
+    The joined result lands in the persistent cache, and a warm text is
+    yielded whole in one step.
 
-def get_native_language_name(lang_code):
-    """
-    Get the native language name from a language code
-    
     Args:
-        lang_code (str): Language code (e.g., 'en', 'es')
-        
-    Returns:
-        str: Native language name
+        text (str): Text to translate
+        to_lang (str): Target language code
+        from_lang (str): Source language code
+
+    Yields:
+        str: Translated chunks in the original order
     """
-    return NATIVE_LANGUAGE_DICT.get(lang_code, lang_code)
+    if not text:
+        return
+
+    if not to_lang or to_lang == from_lang:
+        yield text
+        return
+
+    cache_key = _translation_key(text, to_lang, from_lang)
+    cached = cache.get_cached_translation(cache_key, to_lang)
+    if cached is not None:
+        yield cached
+        return
+
+    try:
+        if len(text) < 200:
+            translated = basic_translate(text, to_lang, from_lang)
+            # basic_translate returns the input unchanged on failure;
+            # don't pin a failed lookup in the cache for a week
+            if translated != text:
+                cache.store_translation(cache_key, from_lang, to_lang, translated)
+            yield translated
+            return
+
+        chunks = split_text_into_chunks(text)
+        if not chunks:
+            return
+
+        batches = _group_chunks_into_batches(chunks)
+
+        # All batches translate concurrently; iterating the futures in
+        # submission order makes ordered emission automatic — a batch
+        # that finishes early simply waits its turn
+        futures = [
+            _TRANSLATE_EXECUTOR.submit(_translate_batch, batch, to_lang, from_lang)
+            for batch in batches
+        ]
+
+        parts = []
+        for future in futures:
+            translated_batch = future.result()
+            piece = ' '.join(translated_batch)
+            yield piece if not parts else ' ' + piece
+            parts.extend(translated_batch)
+
+        # A result identical to the input means every chunk fell back;
+        # don't pin that failure in the cache for a week
+        result = ' '.join(parts)
+        if result != text:
+            cache.store_translation(cache_key, from_lang, to_lang, result)
+    except Exception as e:
+        st.error(f"Translation error: {str(e)}")
+        yield text  # Fall back to the original text
 
+# A line that looks like a section header: stripped form is 1-99 chars
+# and doesn't end with a period. Same heuristic as the old per-line
+# loop, but evaluated by the regex engine in one pass over the text
+_HEADER_LINE = re.compile(r'^[^\S\n]*([^\s.]|\S[^\n]{0,97}[^\s.])[^\S\n]*$', re.MULTILINE)
+
+@st.cache_data(show_spinner=False, max_entries=256)
 def split_content_into_sections(content):
     """
     Split article content into sections for collapsible viewing
-    
+
+    Header detection runs as a single compiled-regex scan and section
+    bodies are slices of the original text, instead of a Python loop
+    over every line appending to a string.
+
     Args:
         content (str): Article content text
-        
+
     Returns:
         list: List of dictionaries with section titles and content
     """
     if not content:
         return []
-    
-    # Simple section detection by looking for lines that might be headers
-    lines = content.split('\n')
+
     sections = []
-    current_section = {"title": "Introduction", "content": ""}
-    
-    for line in lines:
-        # Check if line looks like a section header (not perfect but works for basic cases)
-        if line.strip() and len(line.strip()) < 100 and not line.strip().endswith('.'):
-            # If we've accumulated content in the current section, add it to sections
-            if current_section["content"].strip():
-                sections.append(current_section)
-            
-            # Start a new section
-            current_section = {
-                "title": line.strip(),
-                "content": ""
-            }
-        else:
-            # Add line to current section
-            current_section["content"] += line + "\n"
-    
+    current_title = "Introduction"
+    body_start = 0
+
+    for match in _HEADER_LINE.finditer(content):
+        body = content[body_start:match.start()]
+        if body.strip():
+            sections.append({"title": current_title, "content": body})
+
+        # Start a new section at this header; group 1 is pre-stripped
+        current_title = match.group(1)
+        body_start = match.end()
+
     # Add the last section if it has content
-    if current_section["content"].strip():
-        sections.append(current_section)
-    
+    body = content[body_start:]
+    if body.strip():
+        sections.append({"title": current_title, "content": body})
+
     return sections
 
 def display_collapsible_sections(sections, article_id=None, context=None, highlight_mode=False):